@@ -11,16 +11,22 @@ Dec
 """
 
 from abc import ABC
+from functools import cached_property
 
 import sage.all  # noqa: F401 (required by sage)
 from Crypto.Util.strxor import strxor
 from sage.coding.decoder import DecodingError
-from sage.coding.linear_rank_metric import rank_weight
 from sage.modules.free_module import FreeModule_ambient_field as VectorSpace
-from sage.rings.finite_rings.finite_field_constructor import GF
 
-from .io import BYTE_SIZE, decode, encode
-from .matrix import random_rank_vector
+from .io import (
+    BYTE_SIZE,
+    binary_field,
+    decode,
+    encode,
+    encode_elem_list,
+    encode_int_list,
+)
+from .matrix import random_rank_integers, rank_over_gf2
 
 
 class Cipher(ABC):
@@ -47,18 +53,22 @@ class Cipher(ABC):
         """
         return self._key.m() * self._key.n() // BYTE_SIZE
 
+    @cached_property
     def _message_space(self):
         """Return the underlying Gabidulin code message space."""
-        return VectorSpace(self._extension_field(), self._key.k())
+        return VectorSpace(self._extension_field, self._key.k())
 
+    @cached_property
     def _codeword_space(self):
         """Return the underlying Gabidulin code codeword space."""
-        return VectorSpace(self._extension_field(), self._key.n())
+        return VectorSpace(self._extension_field, self._key.n())
 
+    @cached_property
     def _extension_field(self):
         """Return the underlying Gabidulin code extension field."""
-        return GF(2 ** self._key.m())
+        return binary_field(self._key.m())
 
+    @cached_property
     def _decoding_capacity(self):
         """Compute the maximum number of errors that can be corrected in
         decryption."""
@@ -80,7 +90,8 @@ class Enc(Cipher):
         public_key : PublicKey
             The public key used to encrypt.
         hash_algorithm : HashFunction
-            The hash function object used to compute the verification hash.
+            The hash function object used to compute the verification hash. It
+            must provide `digest_of`, as subclasses of `HashFunction` do.
         xof_algorithm : ExtendableOutputFunction
             The extendable-output function object used to compute the error
             hash.
@@ -89,6 +100,14 @@ class Enc(Cipher):
         self._hash = hash_algorithm
         self._xof = xof_algorithm
 
+        m, n, k = public_key.m(), public_key.n(), public_key.k()
+
+        # the generator matrix is systematic, so only its right block is used
+        self._g_right = public_key.g().submatrix(0, k)
+
+        # whether both codeword blocks start and end on byte boundaries
+        self._byte_aligned = (m * k) % BYTE_SIZE == 0 and (m * n) % BYTE_SIZE == 0
+
     def __call__(self, plaintext):
         """Encrypt the given plaintext.
 
@@ -102,18 +121,29 @@ class Enc(Cipher):
         bytes
             The encrypted bytes.
         """
-        rank = self._decoding_capacity()
-        error = encode(random_rank_vector(self._codeword_space(), rank))
+        m, n = self._key.m(), self._key.n()
+        error = random_rank_integers(m, n, self._decoding_capacity)
+        error = encode_int_list(error, m)
+
+        verifier_hash = self._hash.digest_of(error, plaintext)
 
-        verifier_hash = self._hash(error + plaintext)
-        extended_plaintext = plaintext + verifier_hash
+        # the extended plaintext is masked in place to avoid another buffer
+        message = bytearray(plaintext)
+        message += verifier_hash
 
-        error_hash = self._xof(error, len(extended_plaintext))
+        error_hash = self._xof(error, len(message))
+        strxor(message, error_hash, output=message)
 
-        message = strxor(extended_plaintext, error_hash)
-        message = decode(message, self._message_space())
+        masked = message
+        message = decode(masked, self._message_space)
+        redundancy = message * self._g_right
+
+        if self._byte_aligned:
+            # the message block of the codeword encodes to the masked bytes
+            codeword = masked + encode(redundancy)
+        else:
+            codeword = encode_elem_list(message.list() + redundancy.list())
 
-        codeword = encode(message * self._key.g())
         ciphertext = strxor(codeword, error)
 
         return ciphertext
@@ -134,7 +164,8 @@ class Dec(Cipher):
         secret_key : SecretKey
             The private key used to decrypt.
         hash_algorithm : HashFunction
-            The hash function object used to compute the verification hash.
+            The hash function object used to compute the verification hash. It
+            must provide `digest_of`, as subclasses of `HashFunction` do.
         xof_algorithm : ExtendableOutputFunction
             The extendable-output function object used to compute the error
             hash.
@@ -143,6 +174,8 @@ class Dec(Cipher):
         self._hash = hash_algorithm
         self._xof = xof_algorithm
 
+        self._p_inverse = secret_key.p().inverse()
+
     def __call__(self, ciphertext):
         """Decrypt the given plaintext.
 
@@ -161,10 +194,10 @@ class Dec(Cipher):
         DecodingError
             If decryption fails.
         """
-        received_word = decode(ciphertext, self._codeword_space())
+        received_word = decode(ciphertext, self._codeword_space)
         codeword = self._key.c().decode_to_code(received_word * self._key.p())
 
-        error_vector = received_word + codeword * self._key.p().inverse()
+        error_vector = received_word + codeword * self._p_inverse
         error = encode(error_vector)
 
         message = encode(self._key.c().unencode(codeword) * self._key.s())
@@ -172,13 +205,16 @@ class Dec(Cipher):
         extended_plaintext = strxor(message, self._xof(error, len(message)))
         plaintext, verifier_hash = self._extract_hash(extended_plaintext)
 
-        hash_verified = verifier_hash == self._hash(error + plaintext)
-        rank_verified = rank_weight(error_vector) == self._decoding_capacity()
+        # either check is enough, and the hash is the cheaper one
+        if verifier_hash == self._hash.digest_of(error, plaintext):
+            return plaintext
+
+        coordinates = (int(e.integer_representation()) for e in error_vector)
 
-        if not hash_verified and not rank_verified:
-            raise DecodingError()
+        if rank_over_gf2(coordinates) == self._decoding_capacity:
+            return plaintext
 
-        return plaintext
+        raise DecodingError()
 
     def _extract_hash(self, extended_plaintext):
         """Split the extended plaintext into a plaintext and a verification hash in
@@ -17,15 +17,15 @@ SHAKE:
 """
 
 from abc import ABC
-
-from Crypto.Hash import SHA3_256, SHA3_384, SHA3_512, SHAKE128, SHAKE256
+from hashlib import sha3_256, sha3_384, sha3_512, shake_128, shake_256
 
 
 class HashFunction(ABC):
     """Abstract class for hash functions.
 
     Functions used with this cryptosystem shall implement the interface
-    defined in this class.
+    defined in this class. The ciphers call `digest_of`, so hash functions
+    should inherit from this class to get its default implementation.
     """
 
     def __call__(self, data):
@@ -38,6 +38,19 @@ class HashFunction(ABC):
         """
         NotImplemented
 
+    def digest_of(self, *parts):
+        """Compute the message digest of the concatenation of `parts`.
+
+        Implementations may override this method to hash the parts
+        incrementally instead of concatenating them first.
+
+        Parameters
+        ----------
+        *parts : bytes
+            Input data split into consecutive parts.
+        """
+        return self(b"".join(parts))
+
     def digest_size(self):
         """Return the digest size in bytes.
 
@@ -69,14 +82,14 @@ class ExtendableOutputFunction(ABC):
         NotImplemented
 
 
-class SHA3:
+class SHA3(HashFunction):
     """Implementation of SHA-3 hash functions.
 
     Internally, this class uses one of the SHA3 implementations from
-    PyCryptodome, depending on the security level.
+    hashlib, depending on the security level.
     """
 
-    _IMPL = {128: SHA3_256, 192: SHA3_384, 256: SHA3_512}
+    _IMPL = {128: sha3_256, 192: sha3_384, 256: sha3_512}
 
     def __init__(self, security_level):
         """Create a suitable SHA-3 hash function to use with the cryptosystem.
@@ -97,21 +110,31 @@ class SHA3:
         if self._impl is None:
             raise ValueError(f"invalid security parameter {security_level}")
 
+        self._digest_size = self._impl().digest_size
+
     def __call__(self, data):
-        return self._impl.new(data).digest()
+        return self.digest_of(data)
+
+    def digest_of(self, *parts):
+        h = self._impl()
+
+        for part in parts:
+            h.update(part)
+
+        return h.digest()
 
     def digest_size(self):
-        return self._impl.digest_size
+        return self._digest_size
 
 
-class SHAKE:
+class SHAKE(ExtendableOutputFunction):
     """Implementation of SHAKE extendable-output functions.
 
-    Internally, this class uses one of the SHA3 implementations from
-    PyCryptodome, depending on the security level.
+    Internally, this class uses one of the SHAKE implementations from
+    hashlib, depending on the security level.
     """
 
-    _IMPL = {128: SHAKE128, 192: SHAKE256, 256: SHAKE256}
+    _IMPL = {128: shake_128, 192: shake_256, 256: shake_256}
 
     def __init__(self, security_level):
         """Create a suitable SHA-3 extendable-output function to use with the
@@ -134,4 +157,4 @@ class SHAKE:
             raise ValueError(f"invalid security parameter {security_level}")
 
     def __call__(self, data, size):
-        return self._impl.new(data).read(size)
+        return self._impl(data).digest(size)
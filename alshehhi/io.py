@@ -2,25 +2,27 @@
 objects such as lists, matrices, and vectors of finite field elements.
 """
 
-from math import ceil
-from textwrap import wrap
+from functools import lru_cache
 
 import sage.all  # noqa: F401 (required by sage)
-from Crypto.Util import number
-from Crypto.Util.number import long_to_bytes
-from more_itertools import grouper
 from sage.matrix.constructor import matrix
 from sage.matrix.matrix_space import MatrixSpace
 from sage.modules.free_module import FreeModule_ambient_field as VectorSpace
 from sage.modules.free_module_element import vector
 from sage.rings.finite_rings.finite_field_base import FiniteField
 from sage.rings.finite_rings.finite_field_constructor import GF
-from sage.rings.integer import Integer
 from sage.structure.element import FieldElement, Matrix, Vector
 
 """The size of a byte."""
 BYTE_SIZE = 8
 
+"""The binary field, compared by identity to detect elements of GF(2)."""
+_GF2 = GF(2)
+
+"""The number of integers packed at once, a multiple of `BYTE_SIZE` so that
+each group fills a whole number of bytes."""
+_PACK_GROUP_LEN = 8 * BYTE_SIZE
+
 
 def encode(object):
     """Encode a finite field element, a vector, or a matrix according to
@@ -82,16 +84,15 @@ def decode(data, space):
         return decode_elem(data, space)
 
     elif isinstance(space, VectorSpace):
-        elems = decode_elem_list(data, space.base_ring())
-        n = space.degree()
+        field = space.base_ring()
+        entries = _decode_entries(data, field, space.degree())
 
-        return vector(elems[-n:])
+        return vector(field, entries)
 
     elif isinstance(space, MatrixSpace):
-        elems = decode_elem_list(data, space.base_ring())
-        n = space.dimension()
+        entries = _decode_entries(data, space.base_ring(), space.dimension())
 
-        return matrix(space=space, entries=elems[-n:])
+        return matrix(space=space, entries=entries)
 
     else:
         raise ValueError(f"unsupported space: {type(space)}")
@@ -119,16 +120,80 @@ def encode_elem_list(elems):
     encode_elem
     decode_elem_list
 
+    Raises
+    ------
+    ValueError
+        If the characteristic of the field the elements belong is different
+        from 2.
+
     Notes
     -----
     The `decode_list` function can revert the encoding done by this function.
     However, this function does not check if all elements belongs to the same
     field, and in this case `decode_list` will raise an error.
     """
-    bits = "".join(to_str(e) for e in elems)
-    num_bytes = ceil(len(bits) / BYTE_SIZE)
+    if len(elems) == 0:
+        return b""
+
+    field = elems[0].parent()
+
+    if any(e.parent() is not field for e in elems):
+        return _encode_mixed_elem_list(elems)
+
+    if field.characteristic() != 2:
+        raise ValueError("the element is not in a field of characteristic two")
+
+    if field is _GF2:
+        ints = list(map(int, elems))
+    else:
+        to_int = type(elems[0]).integer_representation
+        ints = [int(to_int(e)) for e in elems]
+
+    return encode_int_list(ints, field.degree())
+
+
+def encode_int_list(ints, degree):
+    """Encode a list of integer representations of field elements into bytes.
+
+    Each integer occupy `degree` bits, the same layout `encode_elem_list` uses
+    for elements of a field of degree `degree`. If the sum of the bits is not
+    a mutiple of `BYTE_SIZE`, the result is filled with zeros.
+
+    Parameters
+    ----------
+    ints : list
+        A list of non-negative integers smaller than `2 ** degree`.
+    degree : int
+        The number of bits of each integer.
+
+    Returns
+    -------
+    bytes
+        The encoded integers.
+
+    See Also
+    --------
+    encode_elem_list
+    """
+    if degree % BYTE_SIZE == 0:
+        num_bytes = degree // BYTE_SIZE
+        out = bytearray(num_bytes * len(ints))
+
+        for start, i in zip(range(0, len(out), num_bytes), ints):
+            out[start : start + num_bytes] = i.to_bytes(num_bytes, "big")
+
+        return bytes(out)
+
+    # the leading group carries the padding, the others are byte-aligned, so
+    # the shifted integers stay small no matter the length of the list
+    head_len = len(ints) % _PACK_GROUP_LEN
+    groups = [_pack_ints(ints[:head_len], degree)]
+
+    for start in range(head_len, len(ints), _PACK_GROUP_LEN):
+        group = ints[start : start + _PACK_GROUP_LEN]
+        groups.append(_pack_ints(group, degree))
 
-    return int(bits, 2).to_bytes(num_bytes, "big")
+    return b"".join(groups)
 
 
 def decode_elem_list(data, field, num_of_elems=None):
@@ -156,8 +221,9 @@ def decode_elem_list(data, field, num_of_elems=None):
 
     Raises
     ------
-    RuntimeError
-        If there are not sufficient bytes to fully represent elements.
+    ValueError
+        If there are not sufficient bytes to fully represent elements, or if
+        the characteristic of `field` is different from 2.
 
     See Also
     --------
@@ -167,22 +233,76 @@ def decode_elem_list(data, field, num_of_elems=None):
     if field.characteristic() != 2:
         raise ValueError("the element is not in a field of characteristic two")
 
-    bits = "".join(f"{byte:08b}" for byte in data)
+    ints = decode_int_list(data, field.degree(), num_of_elems)
+
+    if field is _GF2:
+        return [field(i) for i in ints]
+
+    fetch = field.fetch_int
+
+    return [fetch(i) for i in ints]
+
+
+def decode_int_list(data, degree, num_of_ints=None):
+    """Decode bytes into a list of integer representations of field elements.
+
+    This function reverts `encode_int_list`, interpreting `data` the same way
+    `decode_elem_list` does for a field of degree `degree`.
+
+    Parameters
+    ----------
+    data : bytes
+        Representation of the integers.
+    degree : int
+        The number of bits of each integer.
+    num_of_ints : int, optional
+        Number of integers to decode.
+
+    Returns
+    -------
+    list
+        A list of non-negative integers smaller than `2 ** degree`.
+
+    Raises
+    ------
+    ValueError
+        If there are not sufficient bytes to fully represent the integers.
+
+    See Also
+    --------
+    decode_elem_list
+    encode_int_list
+    """
     num_bits = len(data) * BYTE_SIZE
 
-    if num_of_elems is None:
-        padding_len = num_bits % field.degree()
-    else:
-        padding_len = num_bits - field.degree() * num_of_elems
+    if num_of_ints is None:
+        num_of_ints = num_bits // degree
 
-    if padding_len < 0:
+    if num_bits < degree * num_of_ints:
         raise ValueError("there are not enough bytes to decode")
 
-    if field is GF(2):
-        return [field(b) for b in bits]
+    view = memoryview(data)
+
+    if degree % BYTE_SIZE == 0:
+        num_bytes = degree // BYTE_SIZE
+        first = len(data) - num_of_ints * num_bytes
+        starts = range(first, len(data), num_bytes)
+
+        return [int.from_bytes(view[i : i + num_bytes], "big") for i in starts]
+
+    # mirror the groups of `encode_int_list`: the leading group holds the
+    # padding and the remaining groups are byte-aligned
+    group_num_bytes = _PACK_GROUP_LEN * degree // BYTE_SIZE
+    head_len = num_of_ints % _PACK_GROUP_LEN
+    head_end = len(data) - num_of_ints // _PACK_GROUP_LEN * group_num_bytes
 
-    chunks = wrap(bits[padding_len:], field.degree())
-    return [field.fetch_int(int(c, 2)) for c in chunks]
+    ints = _unpack_ints(view[:head_end], degree, head_len)
+
+    for start in range(head_end, len(data), group_num_bytes):
+        group = view[start : start + group_num_bytes]
+        ints += _unpack_ints(group, degree, _PACK_GROUP_LEN)
+
+    return ints
 
 
 def encode_elem(elem):
@@ -215,10 +335,10 @@ def encode_elem(elem):
     if field.characteristic() != 2:
         raise ValueError("the element is not in a field of characteristic two")
 
-    if field is GF(2):
+    if field is _GF2:
         return b"\x00" if elem == 0 else b"\x01"
 
-    num_bytes = ceil(field.degree() / BYTE_SIZE)
+    num_bytes = (field.degree() + BYTE_SIZE - 1) // BYTE_SIZE
     return elem.integer_representation().to_bytes(num_bytes, "big")
 
 
@@ -251,47 +371,86 @@ def decode_elem(data, field=None):
     """
     if field is None:
         deg = len(data) * BYTE_SIZE
-        field = GF(2 ** deg)
+        field = binary_field(deg)
 
     if field.characteristic() != 2:
         raise ValueError("finite field has not characteristic two")
 
-    if field is GF(2):
+    if field is _GF2:
         return field(0) if data == b"\x00" else field(1)
 
     return field.fetch_int(int.from_bytes(data, "big"))
 
 
-def to_str(elem):
-    """Convert a finite field element into a string.
+@lru_cache(maxsize=None)
+def binary_field(degree):
+    """Return the finite field of characteristic 2 of the given degree.
 
-    The characters in the resulting string contains the coefficients of the
-    element.
+    The fields are memoized, so repeated calls return the same object without
+    going through the `GF` factory again.
 
     Parameters
     ----------
-    elem : FiniteRingElement
-        An element over a finite field of characteristic 2.
+    degree : int
+        The degree of the field.
 
     Returns
     -------
-    str
-        A string with the element coefficients.
+    FiniteField
+        The finite field GF(2 ** degree).
+    """
+    return GF(2 ** degree)
 
-    Raises
-    ------
-    ValueError
-        If the characteristic `field` is different from 2.
+
+def _decode_entries(data, field, num_of_elems):
+    """Decode the last `num_of_elems` entries of a vector or a matrix.
+
+    Entries over GF(2) are returned as integers, which Sage coerces when the
+    vector or matrix is built, instead of creating one element per bit.
     """
-    field = elem.parent()
+    if field is _GF2:
+        return decode_int_list(data, 1, num_of_elems)
 
-    if field.characteristic() != 2:
-        raise ValueError("the element is not in a field of characteristic two")
+    return decode_elem_list(data, field, num_of_elems)
+
+
+def _encode_mixed_elem_list(elems):
+    """Encode elements of different fields, each one with the degree of the
+    field it belongs."""
+    bits = 0
+    num_bits = 0
+
+    for e in elems:
+        field = e.parent()
+
+        if field.characteristic() != 2:
+            raise ValueError("the element is not in a field of characteristic two")
+
+        i = int(e) if field is _GF2 else int(e.integer_representation())
+        bits = (bits << field.degree()) | i
+        num_bits += field.degree()
+
+    num_bytes = (num_bits + BYTE_SIZE - 1) // BYTE_SIZE
+
+    return bits.to_bytes(num_bytes, "big")
+
+
+def _pack_ints(ints, degree):
+    """Pack integers of `degree` bits each into the minimum number of bytes,
+    filling the most significant bits with zeros."""
+    bits = 0
+
+    for i in ints:
+        bits = (bits << degree) | i
+
+    num_bytes = (len(ints) * degree + BYTE_SIZE - 1) // BYTE_SIZE
+
+    return bits.to_bytes(num_bytes, "big")
 
-    if field is GF(2):
-        return "0" if elem == 0 else "1"
 
-    coefficients = Integer(elem.integer_representation()).binary()
-    padding = "0" * (field.degree() - len(coefficients))
+def _unpack_ints(data, degree, count):
+    """Unpack the last `count` integers of `degree` bits each from `data`."""
+    bits = int.from_bytes(data, "big")
+    mask = (1 << degree) - 1
 
-    return padding + coefficients
+    return [bits >> (degree * i) & mask for i in reversed(range(count))]
@@ -12,18 +12,25 @@ Dec
 """
 
 from abc import ABC
+from functools import cached_property
 
 import sage.all  # noqa: F401 (required by sage)
 from Crypto.IO import PEM
 from Crypto.Util.asn1 import DerBitString, DerOctetString, DerSequence
 from sage.coding.gabidulin_code import GabidulinCode
+from sage.matrix.constructor import matrix
 from sage.matrix.matrix_space import MatrixSpace
 from sage.matrix.special import identity_matrix
 from sage.modules.free_module import VectorSpace
 from sage.modules.free_module_element import vector
-from sage.rings.finite_rings.finite_field_constructor import GF
 
-from alshehhi.io import decode, decode_elem_list, encode, encode_elem_list
+from alshehhi.io import (
+    binary_field,
+    decode,
+    decode_elem_list,
+    encode,
+    encode_elem_list,
+)
 from alshehhi.matrix import (
     ground_field_extension,
     random_invertible_matrix,
@@ -98,11 +105,20 @@ class SecretKey(Key):
     def public_key(self):
         """Derive the corresponding public key.
 
+        The row scrambler of keys built by `generate` makes the public
+        generator matrix systematic, so only its right block is computed.
+
         Returns
         -------
         PublicKey
         """
-        g = self._s.inverse() * self._c.generator_matrix() * self._p.inverse()
+        k = self.k()
+
+        right = self._p.inverse().submatrix(0, k)
+        right = self._s.inverse() * self._generator_matrix * right
+
+        g = identity_matrix(self._c.base_field(), k).augment(right)
+
         return PublicKey(g, self._d)
 
     def export_pem(self):
@@ -156,10 +172,17 @@ class SecretKey(Key):
             self._d,
         ]
 
-        subfield = GF(2 ** self._d)
+        field = self.p().base_ring()
+        subfield = binary_field(self._d)
 
         basis = ground_field_extension(self.p()).row_space().basis_matrix()
-        subfield_matrix = self.p().apply_map(lambda e: subfield(basis.solve_left(vector(e))))
+
+        # the entries of p span only 2 ** delta elements, so their coordinates
+        # in `basis` are tabulated instead of solved for each entry
+        coordinates = VectorSpace(binary_field(1), basis.nrows())
+        table = {field(v * basis): subfield(v) for v in coordinates}
+
+        subfield_matrix = self.p().apply_map(table.__getitem__)
 
         sequence = [
             DerOctetString(encode_elem_list(self.c().evaluation_points())),
@@ -210,6 +233,11 @@ class SecretKey(Key):
     def delta(self):
         return self._d
 
+    @cached_property
+    def _generator_matrix(self):
+        """Return the generator matrix of the secret code."""
+        return self._c.generator_matrix()
+
 
 class PublicKey(Key):
     """Public key of the encryption scheme."""
@@ -315,12 +343,15 @@ def generate(security_level):
     """
     m, n, k, delta = _select_parameters(security_level)
 
+    field = binary_field(m)
+
     c = _random_gabidulin_code(m, n, k)
-    s = random_invertible_matrix(GF(2 ** m), k)
-    p = random_invertible_subpace_matrix(GF(2 ** m), delta, n)
+    s = random_invertible_matrix(field, k)
+    p = random_invertible_subpace_matrix(field, delta, n)
 
-    t = s * c.generator_matrix() * p.inverse()
-    s = s.inverse() * t.submatrix(ncols=k)
+    # only the left block of s * G * p^-1 is needed to make it systematic
+    t = s * c.generator_matrix() * p.inverse().submatrix(ncols=k)
+    s = s.inverse() * t
 
     return SecretKey(c, s, p, delta)
 
@@ -362,19 +393,21 @@ def import_secret_der(data):
     key = [DerOctetString().decode(item).payload for item in key]
     m, n, k, delta = DerSequence().decode(parameters)
 
-    extension_field = GF(2 ** m)
+    extension_field = binary_field(m)
 
     points = decode_elem_list(key[0], extension_field)
     c = GabidulinCode(extension_field, n, k, evaluation_points=points)
 
-    s = decode(key[1], MatrixSpace(extension_field, k))
+    s = decode_elem_list(key[1], extension_field, k * k)
+    s = matrix(extension_field, k, k, s)
 
-    subfield = GF(2 ** delta)
-    basis_space = MatrixSpace(GF(2), delta, m)
-    support_space = MatrixSpace(subfield, n)
+    subfield = binary_field(delta)
+    basis_space = MatrixSpace(binary_field(1), delta, m)
 
     basis = decode(key[2], basis_space)
-    subfield_matrix = decode(key[3], support_space)
+
+    subfield_matrix = decode_elem_list(key[3], subfield, n * n)
+    subfield_matrix = matrix(subfield, n, n, subfield_matrix)
 
     p = subfield_matrix.apply_map(lambda e: extension_field(vector(e) * basis))
 
@@ -418,10 +451,11 @@ def import_public_der(data):
     key = DerBitString().decode(key).payload[1:]
     m, n, k, delta = DerSequence().decode(parameters)
 
-    extension_field = GF(2 ** m)
+    extension_field = binary_field(m)
 
     left = identity_matrix(extension_field, k)
-    right = decode(key, MatrixSpace(extension_field, k, n - k))
+    right = decode_elem_list(key, extension_field, k * (n - k))
+    right = matrix(extension_field, k, n - k, right)
 
     g = left.augment(right)
 
@@ -444,7 +478,7 @@ def _random_gabidulin_code(m, n, k):
     -------
     GabidulinCode
     """
-    field = GF(2 ** m)
+    field = binary_field(m)
     generator = random_rank_vector(VectorSpace(field, n), n)
 
     return GabidulinCode(field, n, k, evaluation_points=generator.list())
@@ -1,5 +1,7 @@
 """This module provides facilities to generate random matrices and vectors."""
 
+from secrets import randbits
+
 import sage.all  # noqa: F401 (required by sage)
 from sage.coding.linear_rank_metric import from_matrix_representation
 from sage.matrix.constructor import matrix
@@ -9,6 +11,9 @@ from sage.modules.free_module import VectorSpace
 from sage.modules.free_module_element import vector
 from sage.rings.finite_rings.finite_field_constructor import GF
 
+"""The binary field, the ground field of all the extensions used here."""
+_GF2 = GF(2)
+
 
 def random_invertible_matrix(field, order):
     """Generate a random invertible matrix over the given finite field.
@@ -58,18 +63,28 @@ def random_invertible_subpace_matrix(field, subspace_dimension, order):
         raise ValueError(error_msg)
 
     space = field.vector_space(map=False)
-    subspace = VectorSpace(GF(2), subspace_dimension)
+    subspace = VectorSpace(_GF2, subspace_dimension)
+
+    linear_map = _random_linear_map(subspace, space)
 
-    subfield = GF(2 ** subspace_dimension)
-    subfield_matrix = random_invertible_matrix(subfield, order)
+    # the subspace has only 2 ** subspace_dimension elements, so it is listed
+    # once and entries are drawn from it by index
+    images = [field(row) for row in linear_map.rows()]
+    elements = [_linear_combination(images, i) for i in range(2 ** len(images))]
 
-    m = matrix(field, order)
+    # columns are built one at a time and reduced against the accepted ones,
+    # so only a dependent column is drawn again instead of the whole matrix
+    pivots = []
+    columns = []
 
-    while m.rank() != order:
-        linear_map = _random_linear_map(subspace, space)
-        m = subfield_matrix.apply_map(lambda e: field(vector(e) * linear_map))
+    while len(columns) < order:
+        column = [elements[randbits(subspace_dimension)] for _ in range(order)]
+        column = vector(field, column)
 
-    return m
+        if _insert_vector_pivot(pivots, column):
+            columns.append(column)
+
+    return matrix(field, columns).transpose()
 
 
 def random_rank_vector(vector_space, rank):
@@ -89,7 +104,7 @@ def random_rank_vector(vector_space, rank):
     field = vector_space.base_ring()
 
     matrix_space = MatrixSpace(
-        GF(2),
+        _GF2,
         field.degree(),
         vector_space.degree(),
     )
@@ -103,6 +118,77 @@ def random_rank_vector(vector_space, rank):
     return from_matrix_representation(m, field)
 
 
+def random_rank_integers(degree, length, rank):
+    """Generate the integer representation of a random vector with the given
+    rank over GF(2).
+
+    The vector has `length` coordinates over GF(2 ** degree). Each coordinate
+    is represented by the integer whose bits are its coefficients, as returned
+    by `integer_representation`. The vector is built as the product of
+    `rank` linearly independent field elements by a random `rank` x `length`
+    matrix of rank `rank` over GF(2), without creating Sage objects.
+
+    Parameters
+    ----------
+    degree : int
+        Degree of the extension field of the coordinates.
+    length : int
+        Number of coordinates.
+    rank : int
+        Rank of the vector.
+
+    Returns
+    -------
+    list
+        The integer representation of each coordinate.
+
+    Raises
+    ------
+    ValueError
+        Error raised when the rank is greater than the field degree or the
+        vector length.
+    """
+    if rank > min(degree, length):
+        raise ValueError("rank must be less than or equal the field degree and length")
+
+    basis = _random_independent_integers(degree, rank)
+    rows = _random_independent_integers(length, rank)
+
+    coordinates = [0] * length
+
+    for elem, row in zip(basis, rows):
+        for j in range(length):
+            if row >> j & 1:
+                coordinates[j] ^= elem
+
+    return coordinates
+
+
+def rank_over_gf2(ints):
+    """Compute the rank over GF(2) of a sequence of integers.
+
+    Each integer is seen as a vector over GF(2) whose coordinates are its
+    bits, so the rank of a vector over GF(2 ** m) can be computed from the
+    integer representation of its coordinates.
+
+    Parameters
+    ----------
+    ints : iterable
+        Non-negative integers.
+
+    Returns
+    -------
+    int
+        The dimension of the space spanned by `ints` over GF(2).
+    """
+    pivots = {}
+
+    for value in ints:
+        _insert_pivot(pivots, value)
+
+    return len(pivots)
+
+
 def ground_field_extension(m):
     """Convert a matrix over a finite extension of a finite field to a matrix
     over its ground field.
@@ -136,7 +222,117 @@ def _random_linear_map(v, w):
     -------
     A random linear map from `v` to `w`.
     """
-    matrix_space = MatrixSpace(GF(2), v.degree(), w.degree())
+    matrix_space = MatrixSpace(_GF2, v.degree(), w.degree())
     m = random_echelonizable_matrix(matrix_space, v.degree(), max_tries=None)
 
     return m.echelon_form()
+
+
+def _linear_combination(images, coefficients):
+    """Compute the image of a vector over GF(2) under a linear map.
+
+    Parameters
+    ----------
+    images : list
+        Images of the canonical basis vectors.
+    coefficients : int
+        The vector, whose coordinates are the bits of the integer.
+
+    Returns
+    -------
+    The sum of the images selected by the bits of `coefficients`.
+    """
+    selected = (e for i, e in enumerate(images) if coefficients >> i & 1)
+    return sum(selected, images[0].parent().zero())
+
+
+def _insert_vector_pivot(pivots, v):
+    """Reduce a vector against a list of pivots by Gaussian elimination.
+
+    Each pivot is a pair of a coordinate index and a vector whose coordinate
+    at that index is one and whose coordinates at the indices of the previous
+    pivots are zero. If `v` does not reduce to zero, the reduced vector is
+    added to `pivots`.
+
+    Parameters
+    ----------
+    pivots : list
+        List of pairs of coordinate indices and pivot vectors.
+    v : Vector
+        The vector to reduce.
+
+    Returns
+    -------
+    bool
+        Whether `v` is linearly independent of the pivots.
+    """
+    for index, pivot in pivots:
+        if v[index] != 0:
+            v = v - v[index] * pivot
+
+    nonzero = v.nonzero_positions()
+
+    if not nonzero:
+        return False
+
+    index = nonzero[0]
+    pivots.append((index, v / v[index]))
+
+    return True
+
+
+def _random_independent_integers(num_bits, count):
+    """Generate random integers that are linearly independent over GF(2).
+
+    Parameters
+    ----------
+    num_bits : int
+        Number of bits of each integer.
+    count : int
+        Number of integers to generate. It must not exceed `num_bits`.
+
+    Returns
+    -------
+    list
+        The integers seen as vectors of `num_bits` coordinates over GF(2).
+    """
+    ints = []
+    pivots = {}
+
+    while len(ints) < count:
+        candidate = randbits(num_bits)
+
+        if _insert_pivot(pivots, candidate):
+            ints.append(candidate)
+
+    return ints
+
+
+def _insert_pivot(pivots, value):
+    """Reduce an integer seen as a vector over GF(2) against a set of pivots.
+
+    The pivots are indexed by their most significant bit. If `value` does not
+    reduce to zero, the reduced value is added to `pivots`.
+
+    Parameters
+    ----------
+    pivots : dict
+        Map from bit positions to pivot integers.
+    value : int
+        The integer to reduce.
+
+    Returns
+    -------
+    bool
+        Whether `value` is linearly independent of the pivots.
+    """
+    while value:
+        top = value.bit_length() - 1
+
+        if top not in pivots:
+            pivots[top] = value
+            return True
+
+        value ^= pivots[top]
+
+    return False
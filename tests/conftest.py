@@ -1,4 +1,4 @@
-from pytest import mark
+from pytest import fixture, mark
 
 
 def pytest_addoption(parser):
@@ -24,3 +24,23 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         if "slow" in item.keywords:
             item.add_marker(skip_slow)
+
+
+# the fixtures import the key module lazily, so that modules that do not use
+# them, such as test_hash.py, do not load sage
+
+
+@fixture(scope="session", params=[128, 192, 256])
+def secret_key(request):
+    """A freshly generated secret key, shared by the whole session."""
+    from alshehhi.key import generate
+
+    return generate(request.param)
+
+
+@fixture(scope="session", params=[128, 192, 256])
+def cached_secret_key(request):
+    """A secret key loaded from the `data` directory, generated only once."""
+    from .util import load_secret_der
+
+    return load_secret_der(request.param)
@@ -64,3 +64,17 @@ def test_hash_shake_construction(security_level, context):
 def test_hash_shake_digest_size(security_level, digest_size):
     hash_function = SHAKE(security_level)
     assert len(hash_function(b"", digest_size)) == digest_size
+
+
+@mark.parametrize(
+    "security_level, parts",
+    [
+        (128, []),
+        (128, [b"", b"\x00"]),
+        (192, [b"\x01\x02", b"\x03"]),
+        (256, [b"\x04", b"\x05\x06", b"\x07"]),
+    ],
+)
+def test_hash_sha3_digest_of(security_level, parts):
+    hash_function = SHA3(security_level)
+    assert hash_function.digest_of(*parts) == hash_function(b"".join(parts))
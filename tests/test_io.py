@@ -1,13 +1,22 @@
+from random import getrandbits
+
 import sage.all  # noqa: F401 (required by sage)
-from pytest import mark
+from pytest import mark, raises
+from sage.matrix.constructor import matrix
+from sage.matrix.matrix_space import MatrixSpace
 from sage.rings.finite_rings.finite_field_constructor import GF
 
 from alshehhi.io import (
     BYTE_SIZE,
+    binary_field,
+    decode,
     decode_elem,
     decode_elem_list,
+    decode_int_list,
+    encode,
     encode_elem,
     encode_elem_list,
+    encode_int_list,
 )
 
 
@@ -89,6 +98,20 @@ def test_decode_elem(field, data, coefficients):
     assert decode_elem(data) == field(coefficients)
 
 
+@mark.parametrize(
+    "data, coefficient",
+    [
+        (b"\x00", 0),
+        (b"\x02", 1),
+        (b"\x00\x01", 1),
+        (b"\xFF", 1),
+    ],
+)
+def test_decode_elem_binary_field(data, coefficient):
+    # any representation other than a single zero byte decodes to one
+    assert decode_elem(data, GF(2)) == GF(2)(coefficient)
+
+
 @mark.parametrize(
     "field, coefficients, data",
     [
@@ -123,6 +146,39 @@ def test_encode_list(field, coefficients, data):
     assert encode_elem_list(elems) == data
 
 
+@mark.parametrize(
+    "fields, coefficients, data",
+    [
+        (
+            [GF(2 ** 5), GF(2 ** 14)],
+            [[1, 0, 1, 0, 1], [1] + [0] * 12 + [1]],
+            b"\x05\x60\x01",
+        ),
+        (
+            [GF(2), GF(2 ** 11), GF(2)],
+            [1, [1, 0, 0, 1, 0, 0, 1, 1, 0, 1], 1],
+            b"\x15\x93",
+        ),
+    ],
+)
+def test_encode_list_different_fields(fields, coefficients, data):
+    elems = [field(item) for field, item in zip(fields, coefficients)]
+    assert encode_elem_list(elems) == data
+
+
+@mark.parametrize(
+    "degree, ints, data",
+    [
+        (11, [], b""),
+        (1, [0, 0, 1, 0, 1, 0, 0], b"\x14"),
+        (11, [914, 1384, 413], b"\x00\xE4\xAB\x41\x9D"),
+        (16, [0x0102, 0xFFFF], b"\x01\x02\xFF\xFF"),
+    ],
+)
+def test_encode_int_list(degree, ints, data):
+    assert encode_int_list(ints, degree) == data
+
+
 @mark.parametrize(
     "field, data, coefficients",
     [
@@ -155,3 +211,79 @@ def test_encode_list(field, coefficients, data):
 def test_decode_list(field, coefficients, data):
     elems = [field(item) for item in coefficients]
     assert decode_elem_list(data, field) == elems
+
+
+@mark.parametrize(
+    "field, data, num_of_elems",
+    [
+        (GF(2), b"", 1),
+        (GF(2), b"\x14", 9),
+        (GF(2 ** 11), b"\x02", 1),
+        (GF(2 ** 11), b"\x00\xE4\xAB\x41", 3),
+    ],
+)
+def test_decode_list_insufficient_bytes(field, data, num_of_elems):
+    with raises(ValueError):
+        decode_elem_list(data, field, num_of_elems)
+
+
+@mark.parametrize(
+    "degree, data, num_of_ints, ints",
+    [
+        (11, b"", None, []),
+        (1, b"\x14", None, [0, 0, 0, 1, 0, 1, 0, 0]),
+        (11, b"\x00\xE4\xAB\x41\x9D", None, [914, 1384, 413]),
+        (11, b"\x00\xE4\xAB\x41\x9D", 2, [1384, 413]),
+        (16, b"\x01\x02\xFF\xFF", None, [0x0102, 0xFFFF]),
+    ],
+)
+def test_decode_int_list(degree, data, num_of_ints, ints):
+    assert decode_int_list(data, degree, num_of_ints) == ints
+
+
+@mark.parametrize(
+    "rows, data",
+    [
+        ([[1, 0, 1], [0, 0, 1]], b"\x29"),
+        ([[1] * 8, [0] * 7 + [1]], b"\xFF\x01"),
+        ([[1, 1, 0, 1, 1], [0, 1, 1, 1, 0], [1, 0, 0, 0, 1]], b"\x6D\xD1"),
+    ],
+)
+def test_encode_binary_matrix(rows, data):
+    m = matrix(GF(2), rows)
+    space = MatrixSpace(GF(2), m.nrows(), m.ncols())
+
+    assert encode(m) == data
+    assert decode(data, space) == m
+
+
+@mark.parametrize("degree", [1, 3, 12, 64])
+def test_binary_field(degree):
+    assert binary_field(degree) is GF(2 ** degree)
+    assert binary_field(degree) is binary_field(degree)
+
+
+@mark.parametrize(
+    "field, num_of_elems",
+    [
+        (GF(2), 200),
+        (GF(2 ** 3), 3364),
+        (GF(2 ** 11), 65),
+        (GF(2 ** 11), 129),
+        (GF(2 ** 64), 840),
+    ],
+)
+def test_encode_decode_long_list(field, num_of_elems):
+    elems = [field.random_element() for _ in range(num_of_elems)]
+    data = encode_elem_list(elems)
+
+    assert len(data) * BYTE_SIZE - field.degree() * num_of_elems < BYTE_SIZE
+    assert decode_elem_list(data, field, num_of_elems) == elems
+
+
+@mark.parametrize("degree, num_of_ints", [(5, 64), (5, 130), (96, 100)])
+def test_encode_decode_long_int_list(degree, num_of_ints):
+    ints = [getrandbits(degree) for _ in range(num_of_ints)]
+    data = encode_int_list(ints, degree)
+
+    assert decode_int_list(data, degree, num_of_ints) == ints
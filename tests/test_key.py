@@ -1,27 +1,16 @@
 from pytest import mark
 
 from alshehhi.key import (
-    generate,
     import_public_der,
     import_public_pem,
     import_secret_der,
     import_secret_pem,
 )
 
-from .util import load_secret_der
-
 
 @mark.slow
-@mark.parametrize(
-    "security_level",
-    [
-        128,
-        192,
-        256,
-    ],
-)
-def test_export_import_secret_der(security_level):
-    original = generate(security_level)
+def test_export_import_secret_der(secret_key):
+    original = secret_key
     imported = import_secret_der(original.export_der())
 
     assert original.c().generator_matrix() == imported.c().generator_matrix()
@@ -30,18 +19,8 @@ def test_export_import_secret_der(security_level):
     assert original._d == imported._d
 
 
-@mark.parametrize(
-    "security_level",
-    [
-        128,
-        192,
-        256,
-    ],
-)
-def test_export_public_der(security_level):
-    sk = load_secret_der(security_level)
-
-    original = sk.public_key()
+def test_export_public_der(cached_secret_key):
+    original = cached_secret_key.public_key()
     imported = import_public_der(original.export_der())
 
     assert original.g() == imported.g()
@@ -49,16 +28,8 @@ def test_export_public_der(security_level):
 
 
 @mark.slow
-@mark.parametrize(
-    "security_level",
-    [
-        128,
-        192,
-        256,
-    ],
-)
-def test_export_import_secret_pem(security_level):
-    original = generate(security_level)
+def test_export_import_secret_pem(secret_key):
+    original = secret_key
     imported = import_secret_pem(original.export_pem())
 
     assert original.c().generator_matrix() == imported.c().generator_matrix()
@@ -67,18 +38,8 @@ def test_export_import_secret_pem(security_level):
     assert original._d == imported._d
 
 
-@mark.parametrize(
-    "security_level",
-    [
-        128,
-        192,
-        256,
-    ],
-)
-def test_export_public_pem(security_level):
-    sk = load_secret_der(security_level)
-
-    original = sk.public_key()
+def test_export_public_pem(cached_secret_key):
+    original = cached_secret_key.public_key()
     imported = import_public_pem(original.export_pem())
 
     assert original.g() == imported.g()
@@ -2,9 +2,15 @@ from contextlib import nullcontext
 
 import sage.all  # noqa: F401 (required by sage)
 from pytest import mark, param, raises
+from sage.matrix.constructor import matrix
 from sage.rings.finite_rings.finite_field_constructor import GF
 
-from alshehhi.matrix import random_invertible_subpace_matrix
+from alshehhi.matrix import (
+    ground_field_extension,
+    random_invertible_subpace_matrix,
+    random_rank_integers,
+    rank_over_gf2,
+)
 
 
 @mark.parametrize(
@@ -26,5 +32,45 @@ def test_random_invertible_subspace_matrix(
     context,
 ):
     with context:
-        m = random_invertible_subpace_matrix(field, subspace_dimension, order)
-        assert m.rank() == order
+        # the matrices are random, so several samples are checked per case
+        for _ in range(16):
+            m = random_invertible_subpace_matrix(field, subspace_dimension, order)
+
+            assert m.dimensions() == (order, order)
+            assert m.rank() == order
+            assert ground_field_extension(m).rank() <= subspace_dimension
+
+
+@mark.parametrize(
+    "degree, length, rank, context",
+    [
+        (4, 4, 0, nullcontext()),
+        (4, 6, 2, nullcontext()),
+        (8, 5, 5, nullcontext()),
+        (64, 58, 7, nullcontext()),
+        param(3, 6, 4, raises(ValueError)),
+        param(6, 3, 4, raises(ValueError)),
+    ],
+)
+def test_random_rank_integers(degree, length, rank, context):
+    with context:
+        coordinates = random_rank_integers(degree, length, rank)
+        bits = [[c >> i & 1 for c in coordinates] for i in range(degree)]
+
+        assert len(coordinates) == length
+        assert all(0 <= c < 2 ** degree for c in coordinates)
+        assert matrix(GF(2), bits).rank() == rank
+
+
+@mark.parametrize(
+    "ints, rank",
+    [
+        ([], 0),
+        ([0, 0], 0),
+        ([0b101, 0b011, 0b110], 2),
+        ([0b1000, 0b0100, 0b0010, 0b0001], 4),
+        ([2 ** 127, 2 ** 127 + 1, 1, 3], 3),
+    ],
+)
+def test_rank_over_gf2(ints, rank):
+    assert rank_over_gf2(ints) == rank
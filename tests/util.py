@@ -1,22 +1,33 @@
-from os import mkdir
-from os.path import exists, isfile
+from functools import lru_cache
+from os import getpid, makedirs, replace
+from os.path import isfile
 
+from alshehhi import __version__
 from alshehhi.key import generate, import_secret_der
 
 
+@lru_cache(maxsize=None)
 def load_secret_der(security_level):
     dir_name = "data"
-    filename = f"{dir_name}/sk_{security_level}.der"
+
+    # keys written by other versions of the package may not import anymore
+    filename = f"{dir_name}/sk_{security_level}_{__version__}.der"
 
     if isfile(filename):
-        data = open(filename, "rb").read()
-        return import_secret_der(data)
+        with open(filename, "rb") as file:
+            return import_secret_der(file.read())
 
     sk = generate(security_level)
 
-    if not exists(dir_name):
-        mkdir(dir_name)
+    makedirs(dir_name, exist_ok=True)
+
+    # write to a private file first, so that concurrent test workers never
+    # read a partially written key
+    tmp_filename = f"{filename}.{getpid()}"
+
+    with open(tmp_filename, "wb") as file:
+        file.write(sk.export_der())
 
-    open(filename, "wb").write(sk.export_der())
+    replace(tmp_filename, filename)
 
     return sk